@@ -11,18 +11,19 @@ References:
 
 import random
 
+from collections import deque
 from collections.abc import Iterable
 from typing import Any
 
 
-_CARD_SCORE = [
+_CARD_SCORE = (
 #   A, 2, 3, 4, 5, 6, 7, 8, 9, 10, J, Q, K
     1, 0, 0, 0, 0, 0, 0, 0, 0,  1, 1, 1, 1,  # Spades
     1, 0, 0, 0, 0, 0, 0, 0, 0,  1, 1, 1, 1,  # Hearts
     1, 1, 0, 0, 0, 0, 0, 0, 0,  1, 1, 1, 1,  # Clubs
     1, 0, 0, 0, 0, 0, 0, 0, 0,  2, 1, 1, 1,  # Diamonds
-]
-_CARD_VALUES = 4 * [
+)
+_CARD_VALUES = 4 * (
     # Aces are 1 or 11 points.
     (1, 11),
 
@@ -31,44 +32,109 @@ _CARD_VALUES = 4 * [
 
     # Jacks, Queens, and Kings are valued 12, 13, and 14 respectively.
     (12,), (13,), (14,),
-]
+)
 
-_CARDSTR_NUM = list("A23456789") + ["10"] + list("JQK")
+# The highest value any card can have, and so the highest sum a take can hit.
+MAX_CARD_VALUE = max(max(values) for values in _CARD_VALUES)
+
+_CARDSTR_NUM = (*"A23456789", "10", *"JQK")
 _CARDSTR_SUIT = "♠♥♣♦"
 
 _NCARDS = 52
 _NSUITS = 4
 
 
+_CARD_STR = tuple(
+    f"[{_CARDSTR_NUM[i % (_NCARDS // _NSUITS)]}"
+    f"{_CARDSTR_SUIT[(i // (_NCARDS // _NSUITS)) % _NSUITS]}]"
+    for i in range(_NCARDS)
+)
+_CARD_REPR = tuple(f"Card({cardstr[1:-1]})" for cardstr in _CARD_STR)
+
+
 assert len(_CARD_SCORE) == _NCARDS
 assert len(_CARD_VALUES) == _NCARDS
 assert len(_CARDSTR_NUM) * len(_CARDSTR_SUIT) == _NCARDS
 
 
+# Filled in with every card once `Card` is defined.
+_CARDS: tuple["Card", ...] = ()
+
+
 class Card(object):
-    def __init__(self, id: int) -> None:
+    """
+    A single card identified by its `id`. Cards are immutable and hash
+    to their `id`. Since a `Card` also compares equal to its integer
+    `id`, `hash(Card(i)) == hash(i)` holds as well, though sets and
+    dicts should still stick to one of the two as keys to stay readable.
+
+    Cards are interned: once the module is loaded, `Card(i)` returns the
+    same shared instance every time.
+    """
+
+    __slots__ = ("_id", "score", "value")
+
+    def __new__(cls, id: int) -> "Card":
         if id not in range(_NCARDS):
             raise ValueError(f"Invalid card '{id}'.")
+        if cls is Card and _CARDS:
+            return _CARDS[id]
 
-        self._id = id
-        self.score = _CARD_SCORE[id]
-        self.value = _CARD_VALUES[id]
+        card = super().__new__(cls)
+        object.__setattr__(card, "_id", id)
+        object.__setattr__(card, "score", _CARD_SCORE[id])
+        object.__setattr__(card, "value", _CARD_VALUES[id])
+        return card
+
+    @classmethod
+    def get(cls, id: int) -> "Card":
+        """
+        Get the shared `Card` instance for `id`. Cards never change
+        after creation, so every caller can share the same 52 objects
+        instead of building new ones.
+
+        :param id: The id of the card to get.
+        :returns: Returns the cached `Card` for `id`.
+        :raises ValueError: The `id` is not a valid card.
+        """
+        if 0 <= id < _NCARDS:
+            return _CARDS[id]
+        return cls(id)
 
     def __eq__(self, other: Any) -> bool:
+        # Check exact types first since almost every comparison is between
+        # two cards, and `isinstance` is slower on this hot path. Plain cards
+        # are interned, so two of them are only equal if they are the same
+        # object. Subclass instances are not interned and compare by id.
+        if type(other) is Card and type(self) is Card:
+            return self is other
+        if type(other) is int:
+            return self._id == other
         if isinstance(other, Card):
             return self._id == other._id
-        return self._id == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._id
+
+    def __reduce__(self) -> tuple[type, tuple[int]]:
+        # Copies and unpickled cards go through `__new__` so they are interned.
+        return (type(self), (self._id,))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"cannot set '{name}': Card is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete '{name}': Card is immutable.")
 
     def __repr__(self) -> str:
-        return f"Card({self.value!r}{self.suit!r})"
+        return _CARD_REPR[self._id]
 
     def __str__(self) -> str:
-        idx_suit = (self._id // (_NCARDS // _NSUITS)) % _NSUITS
-        idx_value = self._id % (_NCARDS // _NSUITS)
+        return _CARD_STR[self._id]
+
 
-        suit = _CARDSTR_SUIT[idx_suit]
-        value = _CARDSTR_NUM[idx_value]
-        return f"[{value}{suit}]"
+_CARDS = tuple(Card(i) for i in range(_NCARDS))
 
 
 class Deck(object):
@@ -84,7 +150,7 @@ class Deck(object):
             raise ValueError(f"requested {n} cards, only {ncards} available.")
 
     def __str__(self) -> str:
-        return "".join(str(card) for card in self._cards)
+        return "".join(_CARD_STR[card._id] for card in self._cards)
 
     def cut_and_draw(self, n: int) -> Iterable[Card]:
         """
@@ -98,10 +164,10 @@ class Deck(object):
         """
         self._validate_can_draw(n)
 
-        cut = random.randint(0, len(self._cards) - 1)
-        self._cards = self._cards[-cut:] + self._cards[:-cut]
+        cut = random.randrange(len(self._cards))
+        self._cards.rotate(cut)
 
-        return tuple(self._cards.pop(0) for _ in range(n))
+        return tuple(self._cards.popleft() for _ in range(n))
 
     def draw(self, n: int) -> Iterable[Card]:
         """
@@ -117,7 +183,7 @@ class Deck(object):
         """
         Reset the deck so it has all of its original cards in order.
         """
-        self._cards = [Card(i) for i in range(_NCARDS)]
+        self._cards = deque(_CARDS)
 
     def shuffle(self) -> None:
         """Shuffle the current cards in the deck."""
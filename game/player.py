@@ -38,7 +38,13 @@ class Player(ABC):
         else:
             collected, cleared = table.take(play, take)
             self._clears += int(cleared)
-            self._collection.extend(collected)
+            self._collect(collected)
+
+    def _collect(self, cards: Iterable[Card]) -> None:
+        """Add `cards` to the player's collection and their score."""
+        cards = list(cards)
+        self._collection.extend(cards)
+        self._score_accum += sum(card.score for card in cards)
 
     def receive_cards(self, cards: Iterable[Card]) -> None:
         self._hand.extend(cards)
@@ -48,10 +54,11 @@ class Player(ABC):
         self._clears = 0        # Number of times this player cleared a table.
         self._collection = []   # The cards collected during play.
         self._hand = []         # The cards currently in the player's hand.
+        self._score_accum = 0   # The total score of `_collection`.
 
     @property
     def score(self) -> int:
-        return self._clears + sum(card.score for card in self._collection)
+        return self._clears + self._score_accum
 
     @abstractmethod
     def strategy(self, table: Table) -> tuple[Card, TakenCards]:
@@ -5,53 +5,151 @@ This file defines the `Table` class. This class defines the common play
 area for the game and enforces the rules of Tablić.
 """
 
-import itertools
 import math
 
 from collections.abc import Collection, Iterable
 
-from .card import Card
+from .card import MAX_CARD_VALUE, Card
 from .exceptions import IllegalMoveException, IllegalStateException
 
 
 TakenCards = Collection[Collection[Card]]
 
 
+# No card is worth more than `MAX_CARD_VALUE`, so no subset summing past it
+# can ever be taken. Reachable sums are kept as bitmasks where bit `s` means
+# sum `s`.
+_TAKE_SUMS_MASK = (1 << (MAX_CARD_VALUE + 1)) - 1
+
+
 class Table(object):
+    """
+    The shared play area. `cards` holds the cards currently on the
+    table and `history` every card played or placed this game, in order.
+
+    The table also tracks both as bitmasks to enforce the rules. Assigning
+    a new list to `cards` or `history` updates them, but the lists must
+    not be edited in place (`append`, `remove`, ...): use `place`, `take`,
+    and `reset` instead, or the table ends up in an inconsistent state.
+    """
+
     def __init__(self) -> None:
         self.reset()
 
     def __str__(self) -> str:
-        return "".join(str(c) for c in self.cards)
+        return "".join(str(c) for c in self._cards)
+
+    def _build_index(self) -> None:
+        """
+        Index every subset of the table that sums to a takeable value
+        by each sum it can reach. Any subset that can no longer sum to a
+        takeable value is dropped, along with all of its supersets since
+        card values are always positive.
+        """
+        # Every subset (as a bitmask of card ids) mapped to a bitmask of its
+        # possible sums. The empty subset, which only reaches 0, seeds the
+        # others.
+        subset_sums = {0: 1}
+        for card in self._cards:
+            bit = 1 << card._id
+            extended = {}
+            for mask, sums in subset_sums.items():
+                # Shifting by each of the card's values adds it to every sum
+                # this subset can already reach.
+                new_sums = 0
+                for value in card.value:
+                    new_sums |= sums << value
+                new_sums &= _TAKE_SUMS_MASK
+
+                if new_sums:
+                    extended[mask | bit] = new_sums
+            subset_sums.update(extended)
+
+        index = {}
+        del subset_sums[0]
+        for mask, sums in subset_sums.items():
+            while sums:
+                lowest = sums & -sums
+                total = lowest.bit_length() - 1
+                index.setdefault(total, []).append(mask)
+                sums ^= lowest
+
+        self._subset_index = index
+        self._index_mask = self._mask
 
     def _cards_sum_to(self, cards: TakenCards, values: tuple[int, ...]) -> bool:
-        for card_values in itertools.product(*[card.value for card in cards]):
-            if sum(card_values) in values:
-                return True
-        return False
+        # Bit `s` of `sums` is set if the cards so far can sum to `s`. Only
+        # aces have a second value, so most cards are a single shift.
+        sums = 1
+        for card in cards:
+            if len(card.value) == 1:
+                sums <<= card.value[0]
+            else:
+                shifted = 0
+                for value in card.value:
+                    shifted |= sums << value
+                sums = shifted
+
+        return any(sums >> value & 1 for value in values)
 
     def _validate_game_state(self, card: Card) -> None:
-        if card in self.cards:
+        bit = 1 << card._id
+        if self._mask & bit:
             raise IllegalStateException(f"{card} already on table - {self}")
-        if card in self.history:
+        if self._history_mask & bit:
             raise IllegalStateException(f"{card} already played")
 
+    @property
+    def cards(self) -> list[Card]:
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards: Iterable[Card]) -> None:
+        self._cards = list(cards)
+        self._mask = 0
+        for card in self._cards:
+            self._mask |= 1 << card._id
+
+    @property
+    def history(self) -> list[Card]:
+        return self._history
+
+    @history.setter
+    def history(self, history: Iterable[Card]) -> None:
+        self._history = list(history)
+        self._history_mask = 0
+        for card in self._history:
+            self._history_mask |= 1 << card._id
+
     def place(self, card: Card) -> None:
         self._validate_game_state(card)
-        self.cards.append(card)
-        self.history.append(card)
+        self._cards.append(card)
+        self._history.append(card)
+        self._mask |= 1 << card._id
+        self._history_mask |= 1 << card._id
 
     def reset(self) -> None:
-        self.cards = []
-        self.history = []
+        self._cards = []
+        self._history = []
         self.last = None
 
+        # Bitmasks mirroring `cards` and `history` where bit `i` is set if the
+        # card with id `i` is in the list. These must be kept in sync with
+        # every change to the lists.
+        self._mask = 0
+        self._history_mask = 0
+
+        # Takeable subsets of `cards` indexed by sum, built on demand by
+        # `takeable` for the table as it was when `_index_mask` was set.
+        self._subset_index = {}
+        self._index_mask = None
+
     def show_table(self) -> str:
-        n = math.ceil(math.sqrt(len(self.cards)))
+        n = math.ceil(math.sqrt(len(self._cards)))
         header = "[EMPTY TABLE]" if n == 0 else "[TABLE]"
 
         print(f"{header} -- LAST: {self.last or 'None'}")
-        for i, card in enumerate(self.cards):
+        for i, card in enumerate(self._cards):
             print(f"{str(card):>6s}")
             if i % n == n - 1:
                 print()
@@ -90,42 +188,90 @@ class Table(object):
         game rules. This is likely the fault of the player.
         """
         self._validate_game_state(played)
-        flat = list(itertools.chain.from_iterable(taken))
+
+        # Flatten the groups and collect their bitmask in the same pass.
+        flat = []
+        taken_mask = 0
+        for cards in taken:
+            flat.extend(cards)
+            for card in cards:
+                taken_mask |= 1 << card._id
 
         # RULE 1
         if len(flat) < 1:
             raise IllegalMoveException("player cannot take own card")
 
-        # RULE 2
-        if played in flat:
-            raise IllegalMoveException(f"card {played} played and taken")
-
         # RULE 3, 4
-        if len(flat) > len(self.cards):
+        if len(flat) > len(self._cards):
             raise IllegalMoveException(
                 "player cannot take more cards than are on the table."
             )
 
-        for i, card in enumerate(flat):
-            # RULE 3
-            if card not in self.cards:
-                raise IllegalMoveException(f"{card} not on table - {self}")
+        # RULE 4: a repeated card sets the same bit twice. Only find which
+        # card it was once we know there is one.
+        if taken_mask.bit_count() != len(flat):
+            seen = 0
+            for card in flat:
+                bit = 1 << card._id
+                if seen & bit:
+                    raise IllegalMoveException(
+                        f"took card {card} more than once"
+                    )
+                seen |= bit
+
+        # RULE 2
+        if taken_mask & (1 << played._id):
+            raise IllegalMoveException(f"card {played} played and taken")
 
-            # RULE 4
-            if card in flat[i + 1:]:
-                raise IllegalMoveException(f"took card {card} more than once")
+        # RULE 3
+        missing = taken_mask & ~self._mask
+        if missing:
+            card = Card((missing & -missing).bit_length() - 1)
+            raise IllegalMoveException(f"{card} not on table - {self}")
 
         # RULE 5
         for cards in taken:
-            if not self._cards_sum_to(cards, played.value):
-                cards = "".join(str(c) for c in self.cards)
+            if len(cards) == 1:
+                # A single card can only be taken by a card of the same rank,
+                # and cards of the same rank share the same values.
+                (card,) = cards
+                legal = card.value == played.value
+            else:
+                legal = self._cards_sum_to(cards, played.value)
+
+            if not legal:
+                cards = "".join(str(c) for c in self._cards)
                 raise IllegalMoveException(f"cannot take {cards} with {played}")
 
         # Make sure we track `played` in our game history and remove any taken
         # cards from the table.
-        self.history.append(played)
-        for card in flat:
-            self.cards.remove(card)
+        self._history.append(played)
+        self._history_mask |= 1 << played._id
+        self._mask ^= taken_mask
+        self._cards = [c for c in self._cards if not taken_mask & (1 << c._id)]
 
-        cleared = bool(len(self.cards) == 0)
+        cleared = bool(len(self._cards) == 0)
         return [played, *flat], cleared
+
+    def takeable(self, value: int) -> list[tuple[Card, ...]]:
+        """
+        Get every group of cards on the table whose values can sum to
+        `value`. This is meant for strategies that want to look at their
+        options without testing each candidate move with `take`.
+
+        The groups are indexed the first time the table is queried after
+        it changes, so repeated queries on the same table are cheap and
+        `place`/`take` never pay for the index.
+
+        :param value: The value the groups should sum to.
+        :returns: A list of groups, each with its cards in table order.
+        Groups may share cards, so a single take can only use groups
+        that don't overlap.
+        """
+        if self._index_mask != self._mask:
+            self._build_index()
+
+        return [
+            tuple(c for c in self._cards if mask & (1 << c._id))
+            for mask in self._subset_index.get(value, ())
+        ]
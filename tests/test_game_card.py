@@ -1,7 +1,9 @@
+import copy
 import itertools
+import pickle
 import pytest
 
-from game.card import Card
+from game.card import MAX_CARD_VALUE, Card
 
 
 class TestCardInitialize(object):
@@ -16,6 +18,24 @@ class TestCardInitialize(object):
             card = Card(i)
             assert card._id == i
 
+    def test_interned(self) -> None:
+        for i in range(52):
+            assert Card(i) is Card(i)
+            assert Card(i) is Card.get(i)
+
+
+class TestCardGet(object):
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            Card.get(-1)
+        with pytest.raises(ValueError):
+            Card.get(52)
+
+    def test_cached(self) -> None:
+        for i in range(52):
+            assert Card.get(i) is Card.get(i)
+            assert Card.get(i) == Card(i)
+
 
 class TestCardDataModel(object):
     def test_eq(self) -> None:
@@ -23,6 +43,43 @@ class TestCardDataModel(object):
         assert Card(0) == 0
         assert Card(0) != Card(1)
         assert Card(0) != 1
+        assert Card(0) != "0"
+        assert Card(0) != None
+
+    def test_eq_subclass(self) -> None:
+        class SubCard(Card): ...
+
+        assert SubCard(0) is not SubCard(0)
+        assert SubCard(0) == SubCard(0)
+        assert SubCard(0) == Card(0)
+        assert Card(0) == SubCard(0)
+        assert SubCard(0) == 0
+        assert SubCard(0) != SubCard(1)
+        assert SubCard(0) != Card(1)
+        assert hash(SubCard(0)) == hash(Card(0))
+        assert SubCard(0) in [Card(0)]
+
+    def test_hash(self) -> None:
+        assert hash(Card(0)) == hash(Card(0))
+        assert hash(Card(0)) == hash(0)
+        assert len({Card(i % 13) for i in range(52)}) == 13
+
+    def test_copy(self) -> None:
+        card = Card(0)
+
+        assert copy.copy(card) is card
+        assert copy.deepcopy(card) is card
+        assert pickle.loads(pickle.dumps(card)) is card
+
+    def test_immutable(self) -> None:
+        card = Card(0)
+
+        with pytest.raises(AttributeError):
+            card.score = 2
+        with pytest.raises(AttributeError):
+            card.other = 0
+        with pytest.raises(AttributeError):
+            del card.value
 
     def test_str(self) -> None:
         suits = "♠♥♣♦"
@@ -32,6 +89,10 @@ class TestCardDataModel(object):
         for i, (suit, value) in enumerate(expected_values):
             assert str(Card(i)) == f"[{value}{suit}]"
 
+    def test_repr(self) -> None:
+        assert repr(Card(0)) == "Card(A♠)"
+        assert repr(Card(48)) == "Card(10♦)"
+
 
 class TestCardScore(object):
     SPECIAL_CASES = (27, 48,)   # 2♣ and 10♦ respectively.
@@ -62,3 +123,7 @@ class TestCardValue(object):
 
             if i % 13 == 0:
                 assert card.value == (1, 11,)
+
+    def test_max_value(self) -> None:
+        assert MAX_CARD_VALUE == max(max(Card(i).value) for i in range(52))
+        assert MAX_CARD_VALUE == 14
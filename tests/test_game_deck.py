@@ -5,7 +5,8 @@ from game.card import Card, Deck
 
 DEFAULT_LEN = 52
 DEFAULT_DRAW = 3
-DEFAULT_CARDS = [Card(i) for i in range(DEFAULT_LEN)]
+CARDS = tuple(Card.get(i) for i in range(DEFAULT_LEN))
+DEFAULT_CARDS = list(CARDS)
 
 
 @pytest.fixture
@@ -15,7 +16,7 @@ def deck() -> Deck:
 
 class TestDeckInitialize(object):
     def test_valid(self, deck) -> None:
-        assert deck._cards == [Card(i) for i in range(DEFAULT_LEN)]
+        assert list(deck._cards) == DEFAULT_CARDS
 
 
 class TestDeckDataModel(object):
@@ -36,12 +37,16 @@ class TestDeckCutAndDraw(object):
         drawn = deck.cut_and_draw(4)
         cut_index = deck._cards[0]._id
 
-        assert drawn == tuple(Card(cut_index - i) for i in range(4, 0, -1))
+        assert drawn == tuple(
+            CARDS[(cut_index - i) % DEFAULT_LEN] for i in range(4, 0, -1)
+        )
         assert len(deck._cards) == DEFAULT_LEN - 4
 
-        expected_cards = [Card(i) for i in range(cut_index, DEFAULT_LEN)]
-        expected_cards += [Card(i) for i in range(cut_index - 4)]
-        assert deck._cards == expected_cards
+        expected_cards = [
+            CARDS[(cut_index + i) % DEFAULT_LEN]
+            for i in range(DEFAULT_LEN - 4)
+        ]
+        assert list(deck._cards) == expected_cards
 
 
 class TestDeckDraw(object):
@@ -54,7 +59,7 @@ class TestDeckDraw(object):
     def test_draw_n(self, n: int, deck) -> None:
         drawn = deck.draw(n)
         assert len(deck._cards) == DEFAULT_LEN - n
-        assert drawn == tuple(Card(DEFAULT_LEN - i - 1) for i in range(n))
+        assert drawn == tuple(CARDS[DEFAULT_LEN - i - 1] for i in range(n))
 
         for card in drawn:
             assert card not in deck._cards
@@ -62,17 +67,17 @@ class TestDeckDraw(object):
 
 class TestDeckReset(object):
     def test_reset(self, deck) -> None:
-        deck._cards = []
-        assert deck._cards != DEFAULT_CARDS
+        deck._cards.clear()
+        assert list(deck._cards) != DEFAULT_CARDS
         deck.reset()
-        assert deck._cards == DEFAULT_CARDS
+        assert list(deck._cards) == DEFAULT_CARDS
 
 
 class TestDeckShuffle(object):
     def test_shuffle(self, deck) -> None:
         deck.shuffle()
         assert len(deck._cards) == DEFAULT_LEN
-        assert deck._cards != DEFAULT_CARDS
+        assert list(deck._cards) != DEFAULT_CARDS
 
         for i in range(DEFAULT_LEN):
-            assert Card(i) in deck._cards
+            assert CARDS[i] in deck._cards
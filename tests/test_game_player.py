@@ -7,23 +7,24 @@ from game.table import Table
 
 
 CARD_POINTS_SUM = 22
+CARDS = tuple(Card.get(i) for i in range(52))
 
 
 @pytest.fixture
 def table() -> Table:
     t = Table()
-    t.last = Card(0)    # Last card is A♠
+    t.last = CARDS[0]   # Last card is A♠
 
     # Place cards 1-4 (2♠, 3♠, 4♠, 5♠) onto the table.
     for i in range(4):
-        t.place(Card(i + 1))
+        t.place(CARDS[i + 1])
 
     return t
 
 
 class MinimalPlayer(Player):
     def strategy(self, table: Table) -> tuple[Card, TakenCards]:
-        return Card(0), []
+        return CARDS[0], []
 
 
 class TestPlayerInitialize(object):
@@ -46,7 +47,7 @@ class TestPlayerInitialize(object):
 class TestPlayerReceiveCards(object):
     @pytest.mark.parametrize("ncards", [0, 1, 3])
     def test_receive_empty_hand(self, ncards: int, table) -> None:
-        cards = [Card(i) for i in range(ncards)]
+        cards = [CARDS[i] for i in range(ncards)]
         player = MinimalPlayer()
         player.receive_cards(cards)
         assert player._hand == cards
@@ -54,22 +55,23 @@ class TestPlayerReceiveCards(object):
     @pytest.mark.parametrize("ncards", [0, 1, 3])
     def test_receive_not_empty_hand(self, ncards: int, table) -> None:
         player = MinimalPlayer()
-        player._hand = [Card(i) for i in range(ncards)]
-        player.receive_cards(Card(i) for i in range(ncards, 2 * ncards))
-        assert player._hand == [Card(i) for i in range(2 * ncards)]
+        player._hand = [CARDS[i] for i in range(ncards)]
+        player.receive_cards(CARDS[i] for i in range(ncards, 2 * ncards))
+        assert player._hand == [CARDS[i] for i in range(2 * ncards)]
 
 
 class TestPlayerReset(object):
     def test_reset(self) -> None:
         player = MinimalPlayer()
         player._clears = 1
-        player._collection = [Card(0)]
-        player._hand = [Card(0)]
+        player._collect([CARDS[0]])
+        player._hand = [CARDS[0]]
         player.reset()
 
         assert player._clears == 0
         assert player._collection == []
         assert player._hand == []
+        assert player.score == 0
 
 
 class TestPlayerScore(object):
@@ -77,24 +79,22 @@ class TestPlayerScore(object):
         assert MinimalPlayer().score == 0
 
     def test_cards_standard(self) -> None:
-        cards = [Card(i) for i in range(52)]
         player = MinimalPlayer()
 
-        for card in cards:
+        for card in CARDS:
             if card.score == 0:
-                player._collection.append(card)
+                player._collect([card])
 
         assert player.score == 0
         player._clears = 4
         assert player.score == 4
 
     def test_cards_with_points(self) -> None:
-        cards = [Card(i) for i in range(52)]
         player = MinimalPlayer()
 
-        for card in cards:
+        for card in CARDS:
             if card.score > 0:
-                player._collection.append(card)
+                player._collect([card])
 
         assert player.score == CARD_POINTS_SUM
         player._clears = 4
@@ -105,7 +105,7 @@ class TestPlayerPlay(object):
     def test_play_illegal_not_in_hand(self, table) -> None:
         class IllegalStrategyPlayer(Player):
             def strategy(self, table: Table) -> tuple[Card, TakenCards]:
-                return Card(0), []
+                return CARDS[0], []
 
         with pytest.raises(IllegalStrategyException):
             IllegalStrategyPlayer().play(table)
@@ -113,10 +113,10 @@ class TestPlayerPlay(object):
     def test_play_illegal_not_collection(self, table) -> None:
         class IllegalStrategyPlayer(Player):
             def strategy(self, table: Table) -> tuple[Card, TakenCards]:
-                return Card(0), Card(1)
+                return CARDS[0], CARDS[1]
 
         player = IllegalStrategyPlayer()
-        player.receive_cards([Card(0)])
+        player.receive_cards([CARDS[0]])
 
         with pytest.raises(IllegalStrategyException):
             player.play(table)
@@ -124,10 +124,10 @@ class TestPlayerPlay(object):
     def test_play_illegal_not_collection_collection(self, table) -> None:
         class IllegalStrategyPlayer(Player):
             def strategy(self, table: Table) -> tuple[Card, TakenCards]:
-                return Card(0), [Card(1)]
+                return CARDS[0], [CARDS[1]]
 
         player = IllegalStrategyPlayer()
-        player.receive_cards([Card(0)])
+        player.receive_cards([CARDS[0]])
 
         with pytest.raises(IllegalStrategyException):
             player.play(table)
@@ -135,10 +135,10 @@ class TestPlayerPlay(object):
     def test_play_illegal_move(self, table) -> None:
         class IllegalStrategyPlayer(Player):
             def strategy(self, table: Table) -> tuple[Card, TakenCards]:
-                return Card(0), [[Card(1)]]
+                return CARDS[0], [[CARDS[1]]]
 
         player = IllegalStrategyPlayer()
-        player.receive_cards([Card(0)])
+        player.receive_cards([CARDS[0]])
 
         with pytest.raises(Exception):
             player.play(table)
@@ -148,7 +148,7 @@ class TestPlayerPlay(object):
             def strategy(self, table: Table) -> tuple[Card, TakenCards]:
                 return self._hand[0], []
 
-        played = Card(0)
+        played = CARDS[0]
         player = PlaceOnlyPlayer()
         player.receive_cards([played])
         player.play(table)
@@ -161,8 +161,8 @@ class TestPlayerPlay(object):
         assert played in table.history
 
     def test_play_legal_take(self, table) -> None:
-        played = Card(14)   # 2♥
-        taken = Card(1)     # 2♠
+        played = CARDS[14]  # 2♥
+        taken = CARDS[1]    # 2♠
 
         class Take2SpadePlayer(Player):
             def strategy(self, table: Table) -> tuple[Card, TakenCards]:
@@ -183,9 +183,9 @@ class TestPlayerPlay(object):
     def test_play_legal_take_all(self, table) -> None:
         class TakeAllPlayer(Player):
             def strategy(self, table: Table) -> tuple[Card, TakenCards]:
-                return Card(6), [[Card(1), Card(4)], [Card(2), Card(3)]]
+                return CARDS[6], [[CARDS[1], CARDS[4]], [CARDS[2], CARDS[3]]]
 
-        played = Card(6)    # 7♠ to take everything.
+        played = CARDS[6]   # 7♠ to take everything.
         player = TakeAllPlayer()
         player.receive_cards([played])
         player.play(table)
@@ -194,7 +194,8 @@ class TestPlayerPlay(object):
         assert player._hand == []
 
         for i in [1, 2, 3, 4, 6]:
-            assert Card(i) in player._collection
+            assert CARDS[i] in player._collection
+        assert player.score == 1 + sum(CARDS[i].score for i in [1, 2, 3, 4, 6])
 
         assert table.cards == []
         assert played in table.history
@@ -6,14 +6,50 @@ from game.exceptions import IllegalMoveException, IllegalStateException
 from game.table import Table
 
 
+CARDS = tuple(Card.get(i) for i in range(52))
+
+_VALID_SUMS_CASES = ((
+    # 5spade = 2spade + 3spade [simple sum]
+    CARDS[4],
+    ((CARDS[1], CARDS[2],),),
+), (
+    # 5spade = 2spade + 3spade = 2heart + 3heart [multiple sum]
+    CARDS[4],
+    (
+        (CARDS[1], CARDS[2],),
+        (CARDS[14], CARDS[15],),
+    ),
+), (
+    # 5spade = 2spade + 3spade = 2heart + 3heart = 5heart [sum, take]
+    CARDS[4],
+    (
+        (CARDS[1], CARDS[2],),
+        (CARDS[14], CARDS[15],),
+        (CARDS[17],),
+    ),
+), (
+    # Aspade = 10spade + Aheart [ace 1 and 11]
+    CARDS[0],
+    ((CARDS[9], CARDS[13]),),
+), (
+    # Aspade = Aheart = Adiamond = Aclub
+    CARDS[0],
+    ((CARDS[13],), (CARDS[26],), (CARDS[39],),),
+), (
+    # Kspade = Aheart + Aclub + 2spade [aces with different values]
+    CARDS[12],
+    ((CARDS[13], CARDS[26], CARDS[1]),),
+),)
+
+
 @pytest.fixture
 def table() -> Table:
     t = Table()
-    t.last = Card(0)
+    t.last = CARDS[0]
 
     # Place cards 1-4 (2, 3, 4, 5 of spades) onto the table.
     for i in range(4):
-        t.place(Card(i + 1))
+        t.place(CARDS[i + 1])
 
     return t
 
@@ -29,10 +65,9 @@ class TestTableInitialize(object):
 
 class TestTablePlace(object):
     def test_legal(self) -> None:
-        cards = [Card(i) for i in range(52)]
         table = Table()
 
-        for card in cards:
+        for card in CARDS:
             table.place(card)
 
             assert table.cards[-1] == card
@@ -40,24 +75,49 @@ class TestTablePlace(object):
 
     def test_illegal_state_already_on_table(self):
         table = Table()
-        table.place(Card(0))
+        table.place(CARDS[0])
 
         with pytest.raises(IllegalStateException):
-            table.place(Card(0))
+            table.place(CARDS[0])
 
     def test_illegal_state_already_played(self):
         table = Table()
-        table.history.append(Card(0))
+        table.place(CARDS[13])
+        table.take(CARDS[0], [[CARDS[13]]])
 
         with pytest.raises(IllegalStateException):
-            table.place(Card(0))
+            table.place(CARDS[0])
+
+
+class TestTableAssign(object):
+    def test_assign_cards(self) -> None:
+        table = Table()
+        table.cards = [CARDS[1]]
+
+        with pytest.raises(IllegalStateException):
+            table.place(CARDS[1])
+
+        cards, cleared = table.take(CARDS[14], [[CARDS[1]]])
+        assert cards == [CARDS[14], CARDS[1]]
+        assert cleared
+
+    def test_assign_history(self) -> None:
+        table = Table()
+        table.history = [CARDS[0]]
+
+        with pytest.raises(IllegalStateException):
+            table.place(CARDS[0])
+
+        table.history = []
+        table.place(CARDS[0])
+        assert table.history == [CARDS[0]]
 
 
 class TestTableReset(object):
     def test_reset(self, table) -> None:
-        assert table.cards == [Card(i + 1) for i in range(4)]
+        assert table.cards == [CARDS[i + 1] for i in range(4)]
         assert table.history == table.cards
-        assert table.last == Card(0)
+        assert table.last == CARDS[0]
 
         table.reset()
 
@@ -65,56 +125,63 @@ class TestTableReset(object):
         assert table.history == []
         assert table.last is None
 
+    def test_reset_allows_replay(self, table) -> None:
+        table.reset()
+
+        for i in range(4):
+            table.place(CARDS[i + 1])
+        assert table.cards == [CARDS[i + 1] for i in range(4)]
+
 
 class TestTableTake(object):
     def test_illegal_own_card(self, table) -> None:
         with pytest.raises(IllegalMoveException):
-            table.take(Card(0), [])
+            table.take(CARDS[0], [])
 
         with pytest.raises(IllegalMoveException):
-            table.take(Card(0), [[]])
+            table.take(CARDS[0], [[]])
 
         with pytest.raises(IllegalMoveException):
-            table.take(Card(0), [[], []])
+            table.take(CARDS[0], [[], []])
 
     def test_illegal_played_and_taken(self, table) -> None:
         with pytest.raises(IllegalMoveException):
-            table.take(Card(0), [[Card(0)]])
+            table.take(CARDS[0], [[CARDS[0]]])
 
     def test_illegal_not_on_table(self, table) -> None:
         with pytest.raises(IllegalMoveException):
-            table.take(Card(0), [[Card(51)]])
+            table.take(CARDS[0], [[CARDS[51]]])
 
     def test_illegal_repeated_card(self, table) -> None:
-        flat = [[Card(1), Card(2), Card(1)]]
+        flat = [[CARDS[1], CARDS[2], CARDS[1]]]
         nest = [[card] for card in flat[0]]
 
         with pytest.raises(IllegalMoveException):
-            table.take(Card(0), flat)
+            table.take(CARDS[0], flat)
 
         with pytest.raises(IllegalMoveException):
-            table.take(Card(0), nest)
+            table.take(CARDS[0], nest)
 
     def test_illegal_too_many_cards(self, table) -> None:
         ncards = len(table.cards) + 1
-        cards_flat = [[Card(i+1) for i in range(ncards)]]
-        cards_nest = [[Card(i+1)] for i in range(ncards)]
+        cards_flat = [[CARDS[i+1] for i in range(ncards)]]
+        cards_nest = [[CARDS[i+1]] for i in range(ncards)]
 
         with pytest.raises(IllegalMoveException):
-            table.take(Card(0), cards_flat)
+            table.take(CARDS[0], cards_flat)
 
         with pytest.raises(IllegalMoveException):
-            table.take(Card(0), cards_nest)
+            table.take(CARDS[0], cards_nest)
 
     def test_illegal_invalid_sum(self, table) -> None:
         with pytest.raises(IllegalMoveException):
-            table.take(Card(0), [[Card(1)]])
+            table.take(CARDS[0], [[CARDS[1]]])
 
     def test_valid_single_same(self) -> None:
         table = Table()
 
         for i in range(52):
-            played, taken = Card(i), Card((i + 13) % 52)
+            played, taken = CARDS[i], CARDS[(i + 13) % 52]
 
             table.place(taken)
             cards, cleared = table.take(played, [[taken]])
@@ -129,8 +196,8 @@ class TestTableTake(object):
         table = Table()
 
         for i in range(52):
-            played = Card(i)
-            taken = [Card((i + j*13) % 52) for j in range(1, 4)]
+            played = CARDS[i]
+            taken = [CARDS[(i + j*13) % 52] for j in range(1, 4)]
 
             for card in taken:
                 table.place(card)
@@ -142,34 +209,7 @@ class TestTableTake(object):
             assert table.history[-1] == played
             table.reset()
 
-    @pytest.mark.parametrize("played,taken", [(
-        # 5spade = 2spade + 3spade [simple sum]
-        Card(4),
-        ((Card(1), Card(2),),),
-    ), (
-        # 5spade = 2spade + 3spade = 2heart + 3heart [multiple sum]
-        Card(4),
-        (
-            (Card(1), Card(2),),
-            (Card(14), Card(15),),
-        ),
-    ), (
-        # 5spade = 2spade + 3spade = 2heart + 3heart = 5heart [sum, take]
-        Card(4),
-        (
-            (Card(1), Card(2),),
-            (Card(14), Card(15),),
-            (Card(17),),
-        ),
-    ), (
-        # Aspade = 10spade + Aheart [ace 1 and 11]
-        Card(0),
-        ((Card(9), Card(13)),),
-    ), (
-        # Aspade = Aheart = Adiamond = Aclub
-        Card(0),
-        ((Card(13),), (Card(26),), (Card(39),),),
-    )])
+    @pytest.mark.parametrize("played,taken", _VALID_SUMS_CASES)
     def test_valid_sums(self, played: Card, taken: tuple) -> None:
         flat = list(itertools.chain.from_iterable(taken))
 
@@ -185,10 +225,67 @@ class TestTableTake(object):
 
     def test_valid_cards_remain(self) -> None:
         table = Table()
-        table.cards = [Card(i+1) for i in range(13)]
+        table.cards = [CARDS[i+1] for i in range(13)]
 
-        cards, cleared = table.take(Card(0), [[Card(13)]])
-        assert cards == [Card(0), Card(13)]
+        cards, cleared = table.take(CARDS[0], [[CARDS[13]]])
+        assert cards == [CARDS[0], CARDS[13]]
         assert not cleared
-        assert table.cards == [Card(i+1) for i in range(12)]
-        assert table.history == [Card(0)]
+        assert table.cards == [CARDS[i+1] for i in range(12)]
+        assert table.history == [CARDS[0]]
+
+    def test_valid_after_take(self, table) -> None:
+        # 5heart = 2spade + 3spade, then place 2heart.
+        table.take(CARDS[17], [[CARDS[1], CARDS[2]]])
+        table.place(CARDS[14])
+
+        # 7heart != 4spade
+        with pytest.raises(IllegalMoveException):
+            table.take(CARDS[19], [[CARDS[3]]])
+
+        # 7heart = 2heart + 5spade
+        cards, cleared = table.take(CARDS[19], [[CARDS[14], CARDS[4]]])
+        assert cards == [CARDS[19], CARDS[14], CARDS[4]]
+        assert not cleared
+        assert table.cards == [CARDS[3]]
+
+
+class TestTableTakeable(object):
+    def test_empty(self) -> None:
+        assert Table().takeable(5) == []
+
+    def test_groups(self, table) -> None:
+        # 5 = 2spade + 3spade = 5spade, 9 = 2spade + 3spade + 4spade = ...
+        assert set(table.takeable(5)) == {(CARDS[1], CARDS[2]), (CARDS[4],)}
+        assert set(table.takeable(9)) == {
+            (CARDS[1], CARDS[2], CARDS[3]),
+            (CARDS[3], CARDS[4]),
+        }
+        assert table.takeable(15) == []
+
+    def test_ace_values(self) -> None:
+        table = Table()
+        table.place(CARDS[13])  # Aheart
+        table.place(CARDS[1])   # 2spade
+
+        assert set(table.takeable(1)) == {(CARDS[13],)}
+        assert set(table.takeable(11)) == {(CARDS[13],)}
+        assert set(table.takeable(3)) == {(CARDS[13], CARDS[1])}
+        assert set(table.takeable(13)) == {(CARDS[13], CARDS[1])}
+
+    def test_updates_after_play(self, table) -> None:
+        assert (CARDS[4],) in table.takeable(5)
+
+        table.take(CARDS[17], [[CARDS[4]]])     # 5heart = 5spade
+        assert set(table.takeable(5)) == {(CARDS[1], CARDS[2])}
+
+        table.place(CARDS[16])                  # 4heart
+        assert set(table.takeable(4)) == {(CARDS[3],), (CARDS[16],)}
+
+    def test_groups_are_legal(self, table) -> None:
+        groups = table.takeable(7)
+        assert len(groups) == 2
+
+        # 7heart can take either group, since they don't share cards.
+        cards, cleared = table.take(CARDS[19], groups)
+        assert cards == [CARDS[19], *groups[0], *groups[1]]
+        assert cleared